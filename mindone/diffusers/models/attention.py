@@ -40,6 +40,43 @@ def _chunked_feed_forward(ff: nn.Cell, hidden_states: ms.Tensor, chunk_dim: int,
     return ff_output
 
 
+def _chunked_modulated_feed_forward(
+    ff: nn.Cell,
+    norm: nn.Cell,
+    hidden_states: ms.Tensor,
+    one_plus_scale: ms.Tensor,
+    shift: ms.Tensor,
+    chunk_dim: int,
+    chunk_size: int,
+):
+    # same as `_chunked_feed_forward`, but normalizes and modulates every chunk right before its feed-forward
+    # so that the full modulated input is never materialized
+    # normalize negative axes so that the batch axis is recognized below whichever way it is spelled
+    chunk_dim = chunk_dim % hidden_states.ndim
+    if hidden_states.shape[chunk_dim] % chunk_size != 0:
+        raise ValueError(
+            f"`hidden_states` dimension to be chunked: {hidden_states.shape[chunk_dim]} has to be divisible by chunk size: {chunk_size}. Make sure to set an appropriate `chunk_size` when calling `enable_forward_chunking` or `JointTransformerBlock.set_chunk_feed_forward`."  # noqa: E501
+        )
+
+    num_chunks = hidden_states.shape[chunk_dim] // chunk_size
+    hid_slices = hidden_states.chunk(num_chunks, axis=chunk_dim)
+    # modulation parameters of shape (batch_size, 1, dim) follow the chunks along the batch axis only
+    if chunk_dim == 0:
+        scale_slices = one_plus_scale.chunk(num_chunks, axis=0)
+        shift_slices = shift.chunk(num_chunks, axis=0)
+    else:
+        scale_slices = (one_plus_scale,) * num_chunks
+        shift_slices = (shift,) * num_chunks
+    ff_output = ops.cat(
+        [
+            ff(norm(hid_slice) * scale_slice + shift_slice)
+            for hid_slice, scale_slice, shift_slice in zip(hid_slices, scale_slices, shift_slices)
+        ],
+        axis=chunk_dim,
+    )
+    return ff_output
+
+
 class GatedSelfAttentionDense(nn.Cell):
     r"""
     A gated self-attention dense layer that combines visual features and object features.
@@ -148,6 +185,19 @@ class JointTransformerBlock(nn.Cell):
         self._chunk_size = chunk_size
         self._chunk_dim = dim
 
+    def _modulated_feed_forward(
+        self, ff: nn.Cell, norm: nn.Cell, hidden_states: ms.Tensor, scale: ms.Tensor, shift: ms.Tensor
+    ) -> ms.Tensor:
+        # broadcast `1 + scale` and `shift` once, they are shared by every feed-forward chunk
+        one_plus_scale = 1 + scale[:, None]
+        shift = shift[:, None]
+        if self._chunk_size is not None:
+            # "feed_forward_chunk_size" can be used to save memory
+            return _chunked_modulated_feed_forward(
+                ff, norm, hidden_states, one_plus_scale, shift, self._chunk_dim, self._chunk_size
+            )
+        return ff(norm(hidden_states) * one_plus_scale + shift)
+
     def construct(self, hidden_states: ms.Tensor, encoder_hidden_states: ms.Tensor, temb: ms.Tensor):
         norm_hidden_states, gate_msa, shift_mlp, scale_mlp, gate_mlp = self.norm1(hidden_states, emb=temb)
 
@@ -168,13 +218,7 @@ class JointTransformerBlock(nn.Cell):
         attn_output = gate_msa.unsqueeze(1) * attn_output
         hidden_states = hidden_states + attn_output
 
-        norm_hidden_states = self.norm2(hidden_states)
-        norm_hidden_states = norm_hidden_states * (1 + scale_mlp[:, None]) + shift_mlp[:, None]
-        if self._chunk_size is not None:
-            # "feed_forward_chunk_size" can be used to save memory
-            ff_output = _chunked_feed_forward(self.ff, norm_hidden_states, self._chunk_dim, self._chunk_size)
-        else:
-            ff_output = self.ff(norm_hidden_states)
+        ff_output = self._modulated_feed_forward(self.ff, self.norm2, hidden_states, scale_mlp, shift_mlp)
         ff_output = gate_mlp.unsqueeze(1) * ff_output
 
         hidden_states = hidden_states + ff_output
@@ -186,15 +230,9 @@ class JointTransformerBlock(nn.Cell):
             context_attn_output = c_gate_msa.unsqueeze(1) * context_attn_output
             encoder_hidden_states = encoder_hidden_states + context_attn_output
 
-            norm_encoder_hidden_states = self.norm2_context(encoder_hidden_states)
-            norm_encoder_hidden_states = norm_encoder_hidden_states * (1 + c_scale_mlp[:, None]) + c_shift_mlp[:, None]
-            if self._chunk_size is not None:
-                # "feed_forward_chunk_size" can be used to save memory
-                context_ff_output = _chunked_feed_forward(
-                    self.ff_context, norm_encoder_hidden_states, self._chunk_dim, self._chunk_size
-                )
-            else:
-                context_ff_output = self.ff_context(norm_encoder_hidden_states)
+            context_ff_output = self._modulated_feed_forward(
+                self.ff_context, self.norm2_context, encoder_hidden_states, c_scale_mlp, c_shift_mlp
+            )
             encoder_hidden_states = encoder_hidden_states + c_gate_mlp.unsqueeze(1) * context_ff_output
 
         return encoder_hidden_states, hidden_states
@@ -212,6 +212,7 @@ class Attention(nn.Cell):
         if processor is None:
             processor = AttnProcessor()
         self.processor = processor
+        self.flash_attention = self._build_flash_attention(processor)
 
     def set_use_memory_efficient_attention_xformers(
         self, use_memory_efficient_attention_xformers: bool, attention_op: Optional[Callable] = None
@@ -328,6 +329,16 @@ class Attention(nn.Cell):
             self._cells.pop("processor")
 
         self.processor = processor
+        self.flash_attention = self._build_flash_attention(processor)
+
+    def _build_flash_attention(self, processor: "AttnProcessor"):
+        # Processors declaring an `input_layout` run `FlashAttentionScore`. Build the primitive once per layer
+        # here instead of instantiating it in every forward pass.
+        input_layout = getattr(processor, "input_layout", None)
+        # Constructing the model must not depend on the primitive, the processor raises when it is actually run.
+        if input_layout is None or not hasattr(ops.operations.nn_ops, "FlashAttentionScore"):
+            return None
+        return ops.operations.nn_ops.FlashAttentionScore(self.heads, scale_value=self.scale, input_layout=input_layout)
 
     def get_processor(self) -> "AttentionProcessor":
         r"""
@@ -804,9 +815,75 @@ class AttnAddedKVProcessor:
         return hidden_states
 
 
+def _to_flash_attention_layout(tensor: ms.Tensor, heads: int, input_layout: str) -> ms.Tensor:
+    # `tensor` comes from the projections in the `BSH` layout, i.e. `(batch_size, seq_len, heads * head_dim)`
+    if input_layout == "BSH":
+        return tensor
+    batch_size, seq_len, inner_dim = tensor.shape
+    tensor = tensor.reshape(batch_size, seq_len, heads, inner_dim // heads)
+    if input_layout == "BNSD":
+        tensor = tensor.swapaxes(1, 2)
+    return tensor
+
+
+def _from_flash_attention_layout(tensor: ms.Tensor, input_layout: str) -> ms.Tensor:
+    if input_layout == "BSH":
+        return tensor
+    if input_layout == "BNSD":
+        tensor = tensor.swapaxes(1, 2)
+    batch_size, seq_len, heads, head_dim = tensor.shape
+    return tensor.reshape(batch_size, seq_len, heads * head_dim)
+
+
+def _check_flash_attention_layout(input_layout: str) -> str:
+    if input_layout not in ("BSH", "BSND", "BNSD"):
+        raise ValueError(f"unknown input_layout: {input_layout}. Should be one of 'BSH', 'BSND' or 'BNSD'")
+    return input_layout
+
+
+def _joint_flash_attention(
+    attn: Attention,
+    query: ms.Tensor,
+    key: ms.Tensor,
+    value: ms.Tensor,
+    attention_mask: Optional[ms.Tensor],
+    input_layout: str,
+) -> ms.Tensor:
+    if attn.flash_attention is None:
+        raise ModuleNotFoundError(
+            f"SD3 joint attention processors run `FlashAttentionScore`, "
+            f"which should be available in `mindspore.ops.operations.nn_ops`. "
+            f"However, we cannot find it in current environment(mindspore version: {ms.__version__})."
+        )
+    # `FlashAttentionScore` only accepts float16 and bfloat16 inputs, other dtypes go through float16.
+    input_dtype = query.dtype
+    cast_to_fp16 = input_dtype not in (ms.float16, ms.bfloat16)
+    if cast_to_fp16:
+        query, key, value = query.to(ms.float16), key.to(ms.float16), value.to(ms.float16)
+    # With the default `BSH` layout flash attention splits the heads itself, so no transposes are needed.
+    query = _to_flash_attention_layout(query, attn.heads, input_layout)
+    key = _to_flash_attention_layout(key, attn.heads, input_layout)
+    value = _to_flash_attention_layout(value, attn.heads, input_layout)
+    hidden_states = attn.flash_attention(query, key, value, None, None, None, attention_mask)[3]
+    hidden_states = _from_flash_attention_layout(hidden_states, input_layout)
+    if cast_to_fp16:
+        hidden_states = hidden_states.to(input_dtype)
+    return hidden_states
+
+
 @ms.jit_class
 class JointAttnProcessor:
-    """Attention processor used typically in processing the SD3-like self-attention projections."""
+    r"""
+    Attention processor used typically in processing the SD3-like self-attention projections.
+
+    Args:
+        input_layout (`str`, *optional*, defaults to `"BSH"`):
+            The layout in which query, key and value are fed to `FlashAttentionScore`. Can be `"BSH"`, `"BSND"` or
+            `"BNSD"`. The fastest one depends on the device and the sequence length.
+    """
+
+    def __init__(self, input_layout: str = "BSH"):
+        self.input_layout = _check_flash_attention_layout(input_layout)
 
     def __call__(
         self,
@@ -815,8 +892,6 @@ class JointAttnProcessor:
         encoder_hidden_states: ms.Tensor = None,
         attention_mask: Optional[ms.Tensor] = None,
     ) -> ms.Tensor:
-        residual = hidden_states
-
         batch_size, channel, height, width = (None,) * 4
         input_ndim = hidden_states.ndim
         if input_ndim == 4:
@@ -828,6 +903,9 @@ class JointAttnProcessor:
             encoder_hidden_states = encoder_hidden_states.view(batch_size, channel, height * width).swapaxes(1, 2)
 
         batch_size = encoder_hidden_states.shape[0]
+        # token counts of the two streams are static for a given resolution and prompt length
+        sequence_length = hidden_states.shape[1]
+        encoder_sequence_length = encoder_hidden_states.shape[1]
 
         # `sample` projections.
         query = attn.to_q(hidden_states)
@@ -844,20 +922,11 @@ class JointAttnProcessor:
         key = ops.cat([key, encoder_hidden_states_key_proj], axis=1)
         value = ops.cat([value, encoder_hidden_states_value_proj], axis=1)
 
-        query = attn.head_to_batch_dim(query)
-        key = attn.head_to_batch_dim(key)
-        value = attn.head_to_batch_dim(value)
-
-        hidden_states = ops.operations.nn_ops.FlashAttentionScore(1, scale_value=attn.scale)(
-            query.to(ms.float16), key.to(ms.float16), value.to(ms.float16), None, None, None, attention_mask
-        )[3].to(query.dtype)
-        hidden_states = attn.batch_to_head_dim(hidden_states)
-        hidden_states = hidden_states.to(query.dtype)
+        hidden_states = _joint_flash_attention(attn, query, key, value, attention_mask, self.input_layout)
 
         # Split the attention outputs.
-        hidden_states, encoder_hidden_states = (
-            hidden_states[:, : residual.shape[1]],
-            hidden_states[:, residual.shape[1] :],
+        hidden_states, encoder_hidden_states = ms.mint.split(
+            hidden_states, [sequence_length, encoder_sequence_length], dim=1
         )
 
         # linear proj
@@ -877,7 +946,16 @@ class JointAttnProcessor:
 
 @ms.jit_class
 class FusedJointAttnProcessor:
-    """Attention processor used typically in processing the SD3-like self-attention projections."""
+    r"""
+    Attention processor used typically in processing the SD3-like self-attention projections with fused projections.
+
+    Args:
+        input_layout (`str`, *optional*, defaults to `"BSH"`):
+            See [`JointAttnProcessor`].
+    """
+
+    def __init__(self, input_layout: str = "BSH"):
+        self.input_layout = _check_flash_attention_layout(input_layout)
 
     def __call__(
         self,
@@ -886,8 +964,6 @@ class FusedJointAttnProcessor:
         encoder_hidden_states: ms.Tensor = None,
         attention_mask: Optional[ms.Tensor] = None,
     ) -> ms.Tensor:
-        residual = hidden_states
-
         batch_size, channel, height, width = (None,) * 4
         input_ndim = hidden_states.ndim
         if input_ndim == 4:
@@ -899,40 +975,27 @@ class FusedJointAttnProcessor:
             encoder_hidden_states = encoder_hidden_states.view(batch_size, channel, height * width).swapaxes(1, 2)
 
         batch_size = encoder_hidden_states.shape[0]
+        # token counts of the two streams are static for a given resolution and prompt length
+        sequence_length = hidden_states.shape[1]
+        encoder_sequence_length = encoder_hidden_states.shape[1]
 
         # `sample` projections.
         qkv = attn.to_qkv(hidden_states)
-        split_size = qkv.shape[-1] // 3
-        query, key, value = ms.mint.split(qkv, split_size, dim=-1)
 
         # `context` projections.
         encoder_qkv = attn.to_added_qkv(encoder_hidden_states)
-        split_size = encoder_qkv.shape[-1] // 3
-        (
-            encoder_hidden_states_query_proj,
-            encoder_hidden_states_key_proj,
-            encoder_hidden_states_value_proj,
-        ) = ms.mint.split(encoder_qkv, split_size, dim=-1)
 
         # attention
-        query = ops.cat([query, encoder_hidden_states_query_proj], axis=1)
-        key = ops.cat([key, encoder_hidden_states_key_proj], axis=1)
-        value = ops.cat([value, encoder_hidden_states_value_proj], axis=1)
-
-        query = attn.head_to_batch_dim(query)
-        key = attn.head_to_batch_dim(key)
-        value = attn.head_to_batch_dim(value)
+        # join the packed projections along the sequence axis once instead of concatenating q, k and v separately
+        qkv = ops.cat([qkv, encoder_qkv], axis=1)
+        split_size = qkv.shape[-1] // 3
+        query, key, value = ms.mint.split(qkv, split_size, dim=-1)
 
-        hidden_states = ops.operations.nn_ops.FlashAttentionScore(1, scale_value=attn.scale)(
-            query.to(ms.float16), key.to(ms.float16), value.to(ms.float16), None, None, None, attention_mask
-        )[3].to(query.dtype)
-        hidden_states = attn.batch_to_head_dim(hidden_states)
-        hidden_states = hidden_states.to(query.dtype)
+        hidden_states = _joint_flash_attention(attn, query, key, value, attention_mask, self.input_layout)
 
         # Split the attention outputs.
-        hidden_states, encoder_hidden_states = (
-            hidden_states[:, : residual.shape[1]],
-            hidden_states[:, residual.shape[1] :],
+        hidden_states, encoder_hidden_states = ms.mint.split(
+            hidden_states, [sequence_length, encoder_sequence_length], dim=1
         )
 
         # linear proj
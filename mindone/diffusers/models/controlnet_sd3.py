@@ -22,7 +22,7 @@ from mindspore import nn
 from ..configuration_utils import ConfigMixin, register_to_config
 from ..loaders import PeftAdapterMixin
 from ..models.attention import JointTransformerBlock
-from ..models.attention_processor import AttentionProcessor
+from ..models.attention_processor import Attention, AttentionProcessor, FusedJointAttnProcessor
 from ..models.modeling_utils import ModelMixin
 from ..utils import logging
 from .controlnet import BaseOutput
@@ -201,6 +201,52 @@ class SD3ControlNetModel(ModelMixin, ConfigMixin, PeftAdapterMixin):
         for name, module in self.name_cells().items():
             fn_recursive_attn_processor(name, module, processor)
 
+    # Copied from mindone.diffusers.models.transformers.transformer_sd3.SD3Transformer2DModel.fuse_qkv_projections
+    def fuse_qkv_projections(self):
+        """
+        Enables fused QKV projections. For self-attention modules, all projection matrices (i.e., query, key, value)
+        are fused. For cross-attention modules, key and value projection matrices are fused.
+
+        <Tip warning={true}>
+
+        This API is 🧪 experimental.
+
+        </Tip>
+        """
+        self.original_attn_processors = None
+
+        for _, attn_processor in self.attn_processors.items():
+            if "Added" in str(attn_processor.__class__.__name__):
+                raise ValueError("`fuse_qkv_projections()` is not supported for models having added KV projections.")
+
+        self.original_attn_processors = self.attn_processors
+
+        for _, module in self.cells_and_names():
+            if isinstance(module, Attention):
+                module.fuse_projections(fuse=True)
+
+        # keep the flash attention layout selected on the current processors
+        self.set_attn_processor(
+            {
+                name: FusedJointAttnProcessor(input_layout=getattr(processor, "input_layout", "BSH"))
+                for name, processor in self.original_attn_processors.items()
+            }
+        )
+
+    # Copied from diffusers.models.unets.unet_2d_condition.UNet2DConditionModel.unfuse_qkv_projections
+    def unfuse_qkv_projections(self):
+        """Disables the fused QKV projection if enabled.
+
+        <Tip warning={true}>
+
+        This API is 🧪 experimental.
+
+        </Tip>
+
+        """
+        if self.original_attn_processors is not None:
+            self.set_attn_processor(self.original_attn_processors)
+
     def _set_gradient_checkpointing(self, module, value=False):
         if hasattr(module, "gradient_checkpointing"):
             module.gradient_checkpointing = value
@@ -23,6 +23,20 @@ TORCH_FP16_BLACKLIST = (
     "AutoencoderTiny",
 )
 
+# a tiny SD3 transformer / controlnet configuration, `attention_head_dim * num_attention_heads` gives the inner dim
+SD3_INIT_KWARGS = {
+    "sample_size": 32,
+    "patch_size": 1,
+    "in_channels": 4,
+    "num_layers": 2,
+    "attention_head_dim": 8,
+    "num_attention_heads": 4,
+    "caption_projection_dim": 32,
+    "joint_attention_dim": 32,
+    "pooled_projection_dim": 64,
+    "out_channels": 4,
+}
+
 
 # copied from mindone.diffusers.models.modeling_utils
 def get_pt2ms_mappings(m):
@@ -177,3 +191,9 @@ def compute_diffs(pt_outputs: torch.Tensor, ms_outputs: ms.Tensor):
         diffs.append(d)
 
     return diffs
+
+
+def compute_diff(x: ms.Tensor, y: ms.Tensor):
+    # relative error defined by Frobenius norm, with `y` as the reference
+    x, y = x.asnumpy(), y.asnumpy()
+    return np.linalg.norm(x - y) / np.linalg.norm(y)
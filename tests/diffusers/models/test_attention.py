@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+import mindspore as ms
+
+from mindone.diffusers.models.attention import JointTransformerBlock
+
+from .modeling_test_utils import compute_diff
+
+THRESHOLD_FP32 = 5e-3
+
+
+@pytest.mark.parametrize("mode", [0, 1])
+# every case splits both the sample and the context tokens into more than one chunk, so that the modulation
+# parameters have to be sliced along with the batch axis (dims 0 / -3) or shared by all chunks (dims 1 / -2)
+@pytest.mark.parametrize(
+    "chunk_dim,chunk_size",
+    [
+        [0, 1],
+        [-3, 1],
+        [1, 4],
+        [-2, 4],
+    ],
+)
+def test_joint_transformer_block_chunk_feed_forward(mode, chunk_dim, chunk_size):
+    ms.set_context(mode=mode, jit_syntax_level=ms.STRICT)
+
+    # SD3 builds its blocks with `attention_head_dim` set to the inner dim
+    block = JointTransformerBlock(dim=32, num_attention_heads=4, attention_head_dim=32)
+    # chunk a separate instance with the same weights, so that no compiled graph is reused across the two runs
+    chunked_block = JointTransformerBlock(dim=32, num_attention_heads=4, attention_head_dim=32)
+    ms.load_param_into_net(chunked_block, block.parameters_dict())
+    chunked_block.set_chunk_feed_forward(chunk_size, dim=chunk_dim)
+
+    inputs = {
+        "hidden_states": ms.Tensor(np.random.randn(2, 16, 32).astype(np.float32)),
+        "encoder_hidden_states": ms.Tensor(np.random.randn(2, 8, 32).astype(np.float32)),
+        "temb": ms.Tensor(np.random.randn(2, 32).astype(np.float32)),
+    }
+
+    outputs = block(**inputs)
+    chunked_outputs = chunked_block(**inputs)
+
+    diffs = [compute_diff(chunked, unchunked) for chunked, unchunked in zip(chunked_outputs, outputs)]
+    assert (np.array(diffs) < THRESHOLD_FP32).all(), f"Outputs({diffs}) has diff bigger than {THRESHOLD_FP32}"
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+import mindspore as ms
+
+from mindone.diffusers.models.attention_processor import (
+    Attention,
+    FusedJointAttnProcessor,
+    JointAttnProcessor,
+    _from_flash_attention_layout,
+    _to_flash_attention_layout,
+)
+from mindone.diffusers.models.controlnet_sd3 import SD3ControlNetModel
+from mindone.diffusers.models.transformers.transformer_sd3 import SD3Transformer2DModel
+
+from .modeling_test_utils import SD3_INIT_KWARGS
+
+
+@pytest.mark.parametrize(
+    "input_layout,expected_shape",
+    [
+        ["BSH", (2, 16, 32)],
+        ["BSND", (2, 16, 4, 8)],
+        ["BNSD", (2, 4, 16, 8)],
+    ],
+)
+def test_flash_attention_layout_round_trip(input_layout, expected_shape):
+    batch_size, seq_len, heads, head_dim = 2, 16, 4, 8
+    x = np.random.randn(batch_size, seq_len, heads * head_dim).astype(np.float32)
+
+    y = _to_flash_attention_layout(ms.Tensor(x), heads, input_layout)
+    assert y.shape == expected_shape
+
+    heads_first = x.reshape(batch_size, seq_len, heads, head_dim).transpose(0, 2, 1, 3)
+    if input_layout == "BNSD":
+        np.testing.assert_array_equal(y.asnumpy(), heads_first)
+
+    z = _from_flash_attention_layout(y, input_layout)
+    np.testing.assert_array_equal(z.asnumpy(), x)
+
+
+@pytest.mark.parametrize("processor_cls", [JointAttnProcessor, FusedJointAttnProcessor])
+def test_joint_attn_processor_input_layout(processor_cls):
+    assert processor_cls().input_layout == "BSH"
+    assert processor_cls(input_layout="BNSD").input_layout == "BNSD"
+    with pytest.raises(ValueError):
+        processor_cls(input_layout="BHSD")
+
+
+@pytest.mark.parametrize("model_cls", [SD3Transformer2DModel, SD3ControlNetModel])
+def test_fuse_qkv_projections_keeps_input_layout(model_cls):
+    model = model_cls(**SD3_INIT_KWARGS)
+    model.set_attn_processor(JointAttnProcessor(input_layout="BNSD"))
+    attns = [module for _, module in model.cells_and_names() if isinstance(module, Attention)]
+    unfused_flash_attentions = [attn.flash_attention for attn in attns]
+
+    model.fuse_qkv_projections()
+
+    processors = model.attn_processors.values()
+    assert all(isinstance(processor, FusedJointAttnProcessor) for processor in processors)
+    assert all(processor.input_layout == "BNSD" for processor in processors)
+    # the primitive has to be rebuilt for the new processors, with the layout they feed it
+    for attn, unfused_flash_attention in zip(attns, unfused_flash_attentions):
+        assert attn.flash_attention is not unfused_flash_attention
+        assert attn.flash_attention.input_layout == "BNSD"
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+import mindspore as ms
+
+from mindone.diffusers.models.controlnet_sd3 import SD3ControlNetModel
+
+from .modeling_test_utils import SD3_INIT_KWARGS, compute_diff
+
+THRESHOLD_FP32 = 5e-3
+
+
+@pytest.mark.parametrize("mode", [0, 1])
+def test_sd3_controlnet_fuse_qkv_projections(mode):
+    ms.set_context(mode=mode, jit_syntax_level=ms.STRICT)
+
+    model = SD3ControlNetModel(**SD3_INIT_KWARGS)
+    # controlnet blocks are zero-initialized, give them weights so that the outputs are not trivially zero
+    for controlnet_block in model.controlnet_blocks:
+        controlnet_block.weight.set_data(
+            ms.Tensor(np.random.randn(*controlnet_block.weight.shape).astype(np.float32))
+        )
+
+    # fuse a separate instance with the same weights, so that no compiled graph is reused across the two runs
+    fused_model = SD3ControlNetModel(**SD3_INIT_KWARGS)
+    ms.load_param_into_net(fused_model, model.parameters_dict())
+    fused_model.fuse_qkv_projections()
+
+    inputs = {
+        "hidden_states": ms.Tensor(np.random.randn(2, 4, 32, 32).astype(np.float32)),
+        "controlnet_cond": ms.Tensor(np.random.randn(2, 4, 32, 32).astype(np.float32)),
+        "encoder_hidden_states": ms.Tensor(np.random.randn(2, 154, 32).astype(np.float32)),
+        "pooled_projections": ms.Tensor(np.random.randn(2, 64).astype(np.float32)),
+        "timestep": ms.Tensor(np.random.randint(0, 1000, size=(2,))),
+    }
+
+    outputs = model(**inputs)[0]
+    fused_outputs = fused_model(**inputs)[0]
+
+    diffs = [compute_diff(fused, unfused) for fused, unfused in zip(fused_outputs, outputs)]
+    assert (np.array(diffs) < THRESHOLD_FP32).all(), f"Outputs({diffs}) has diff bigger than {THRESHOLD_FP32}"